@@ -0,0 +1,480 @@
+#!/usr/bin/env python
+
+import os.path
+import webbrowser
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from functools import partial
+from typing import Callable
+
+import customtkinter as ctk
+from tkcalendar import DateEntry
+
+from WordDateGenerator import DAY_TO_NUM, WordDateGenerator
+
+# Number of unmodified documents kept parsed so switching back to a recent file doesn't parse it again.
+_DOCUMENT_CACHE_SIZE = 4
+
+
+class DateRangeElement(ctk.CTkFrame):
+    def __init__(
+        self,
+        master: ctk.CTkFrame,
+        start_date: datetime = date.today(),
+        end_date: datetime = date.today(),
+        on_remove: Callable[[ctk.CTkFrame], None] = None,
+        *args,
+        **kwargs,
+    ):
+        super().__init__(master, *args, **kwargs)
+
+        self._on_remove = on_remove
+
+        self.grid_columnconfigure(0, weight=1)
+        self.grid_columnconfigure(1, weight=1)
+
+        self._ui_start_date_entry = DateEntry(self)
+        self._ui_start_date_entry.set_date(start_date)
+        self._ui_start_date_entry.grid(row=0, column=0, padx=(0, 5))
+
+        self._ui_end_date_entry = DateEntry(self)
+        self._ui_end_date_entry.set_date(end_date)
+        self._ui_end_date_entry.grid(row=0, column=1, padx=5)
+
+        self._ui_remove_button = ctk.CTkButton(self, width=30, height=30, text="x", command=self._remove_from_list)
+        self._ui_remove_button.grid(row=0, column=2, padx=(5, 0))
+
+    def _remove_from_list(self):
+        if self._on_remove:
+            self._on_remove(self)
+
+        self.destroy()
+
+    def enabled(self, enabled: bool) -> None:
+        if enabled:
+            self._ui_start_date_entry.configure(state="normal")
+            self._ui_end_date_entry.configure(state="normal")
+            self._ui_remove_button.configure(state="normal")
+        else:
+            self._ui_start_date_entry.configure(state="disabled")
+            self._ui_end_date_entry.configure(state="disabled")
+            self._ui_remove_button.configure(state="disabled")
+
+    def get_start_date(self) -> datetime:
+        return self._ui_start_date_entry.get_date()
+
+    def get_end_date(self) -> datetime:
+        return self._ui_end_date_entry.get_date()
+
+
+class App(ctk.CTk):
+    def __init__(self) -> None:
+        super().__init__()
+
+        self.title("Word Date Generator")
+        self.geometry("900x550")
+
+        self.document: WordDateGenerator | None = None
+
+        path_frame = ctk.CTkFrame(self, fg_color="transparent")
+        path_frame.pack(fill=ctk.X, padx=20, pady=20)
+        path_frame.grid_columnconfigure(0, weight=1)
+
+        self._ui_path_entry = ctk.CTkEntry(path_frame, height=50, placeholder_text="Enter the path to the document")
+        self._ui_path_entry.grid(row=0, column=0, sticky="EW")
+        self._ui_path_entry.bind("<KeyRelease>", self._path_entry_handler)
+
+        self._ui_path_picker = ctk.CTkButton(
+            path_frame, height=50, width=75, text="Choose", command=self._open_file_picker
+        )
+        self._ui_path_picker.grid(row=0, column=1)
+
+        options_frame = ctk.CTkFrame(self, fg_color="transparent")
+        options_frame.pack()
+
+        start_date_label = ctk.CTkLabel(options_frame, text="Start Date:")
+        start_date_label.grid(row=0, column=0, padx=5, pady=10, sticky="E")
+
+        self._ui_start_date_picker = DateEntry(options_frame)
+        self._ui_start_date_picker.grid(row=0, column=1, padx=5, pady=10)
+        self._ui_start_date_picker.bind("<<DateEntrySelected>>", self._start_date_picker_handler)
+        self._ui_start_date_picker.bind("<Return>", self._start_date_picker_handler)
+        self._ui_start_date_picker.bind("<FocusOut>", self._start_date_picker_handler)
+        self._ui_start_date_picker.bind("<Leave>", self._start_date_picker_handler)
+
+        end_date_label = ctk.CTkLabel(options_frame, text="End Date:")
+        end_date_label.grid(row=1, column=0, padx=5, pady=10, sticky="E")
+
+        end_date = date.today() + timedelta(days=7)
+        self._ui_end_date_picker = DateEntry(options_frame, year=end_date.year, month=end_date.month, day=end_date.day)
+        self._ui_end_date_picker.grid(row=1, column=1, padx=5, pady=10)
+        self._ui_end_date_picker.bind("<<DateEntrySelected>>", self._end_date_picker_handler)
+        self._ui_end_date_picker.bind("<Return>", self._end_date_picker_handler)
+        self._ui_end_date_picker.bind("<FocusOut>", self._end_date_picker_handler)
+        self._ui_end_date_picker.bind("<Leave>", self._end_date_picker_handler)
+
+        table_index_label = ctk.CTkLabel(options_frame, text="Table:")
+        table_index_label.grid(row=2, column=0, padx=5, pady=10, sticky="E")
+
+        self._ui_table_index = ctk.CTkComboBox(options_frame, values=["1"], command=self._table_index_handler)
+        self._ui_table_index.grid(row=2, column=1, padx=5, pady=10)
+
+        table_column_label = ctk.CTkLabel(options_frame, text="Date Column:")
+        table_column_label.grid(row=3, column=0, padx=5, pady=10, sticky="E")
+
+        self._ui_table_column = ctk.CTkComboBox(options_frame, values=["1"], command=self._table_column_handler)
+        self._ui_table_column.grid(row=3, column=1, padx=5, pady=10)
+
+        date_format_label = ctk.CTkLabel(options_frame, text="Date Format:")
+        date_format_label.grid(row=4, column=0, padx=5, pady=10, sticky="E")
+
+        date_format_frame = ctk.CTkFrame(options_frame, fg_color="transparent")
+        date_format_frame.grid(row=4, column=1, padx=5, pady=10)
+
+        self._ui_date_format = ctk.CTkEntry(date_format_frame)
+        self._ui_date_format.insert(0, "%a. %b. %d")
+        self._ui_date_format.grid(row=0, column=0, padx=5)
+        self._ui_date_format.bind("<KeyRelease>", self._date_format_handler)
+
+        date_format_info_label = ctk.CTkLabel(date_format_frame, text="?")
+        date_format_info_label.grid(row=0, column=1)
+        date_format_info_label.bind(
+            "<Button>",
+            lambda e: webbrowser.open(
+                "https://docs.python.org/3/library/datetime.html#strftime-and-strptime-format-codes"
+            ),
+        )
+
+        self._ui_date_format_preview = ctk.CTkLabel(
+            date_format_frame, text=date.today().strftime(self._ui_date_format.get())
+        )
+        self._ui_date_format_preview.grid(row=1, column=0, columnspan=2, padx=5)
+
+        exclude_days_frame = ctk.CTkFrame(options_frame)
+        exclude_days_frame.grid(row=0, column=2, rowspan=options_frame.grid_size()[1], padx=30)
+
+        exclude_days_label = ctk.CTkLabel(exclude_days_frame, text="Days to exclude:")
+        exclude_days_label.grid(row=0, padx=15, pady=(10, 5))
+
+        self.exclude_day_checkboxes: list[ctk.CTkCheckBox] = []
+        # Kept in sync by `_weekday_checkbox_handler` and shared with the loaded document.
+        self._excluded_days: set[str] = {"saturday", "sunday"}
+
+        for row, weekday in enumerate(DAY_TO_NUM, start=1):
+            checkbox_value = ctk.BooleanVar(self, value=weekday in self._excluded_days)
+            checkbox = ctk.CTkCheckBox(
+                exclude_days_frame,
+                text=weekday.capitalize(),
+                command=partial(self._weekday_checkbox_handler, weekday, checkbox_value),
+                variable=checkbox_value,
+            )
+            checkbox.grid(row=row, padx=15, pady=(5, 15) if weekday == "sunday" else 5, sticky="W")
+            self.exclude_day_checkboxes.append(checkbox)
+
+        self._ui_exclude_range_frame = ctk.CTkFrame(options_frame)
+        self._ui_exclude_range_frame.grid(row=0, column=4, rowspan=options_frame.grid_size()[1], padx=10, sticky="N")
+
+        exclude_range_label = ctk.CTkLabel(self._ui_exclude_range_frame, text="Exclude Range:")
+        exclude_range_label.grid(row=0, padx=15, pady=(10, 5))
+
+        # Keyed by `id()` so removing a range doesn't have to search for it.
+        self.exclude_ranges: dict[int, DateRangeElement] = {}
+
+        # Ranges are packed into their own frame so adding one never has to re-grid the "+" button below it.
+        self._ui_exclude_range_rows = ctk.CTkFrame(
+            self._ui_exclude_range_frame, width=0, height=0, fg_color="transparent"
+        )
+        self._ui_exclude_range_rows.grid(row=1, sticky="EW")
+
+        self._ui_exclude_new_range = ctk.CTkButton(
+            self._ui_exclude_range_frame, text="+", command=self._exclude_new_range_handler
+        )
+        self._ui_exclude_new_range.grid(row=2, padx=15, pady=(10, 15), sticky="EW")
+
+        self._ui_save_as_new_file = ctk.CTkCheckBox(
+            self, text="Save as new file", variable=ctk.BooleanVar(self, value=True)
+        )
+        self._ui_save_as_new_file.pack(pady=(30, 20))
+
+        self._ui_generate_button = ctk.CTkButton(self, height=50, width=150, text="Generate", command=self._generate)
+        self._ui_generate_button.pack()
+
+        # Documents are parsed on a worker thread so large files don't freeze the window while typing a path.
+        self._parse_executor = ThreadPoolExecutor(max_workers=1)
+        self.protocol("WM_DELETE_WINDOW", self._close_handler)
+        self._parse_future: Future | None = None
+        self._pending_parse: str | None = None
+        # Path -> (modification time, document) for documents that haven't had dates added yet.
+        self._doc_cache: OrderedDict[str, tuple[float, WordDateGenerator]] = OrderedDict()
+
+        # Widgets toggled by `_set_ui_state`. Excluded ranges come and go, so they are handled separately.
+        self._state_widgets = [
+            self._ui_start_date_picker,
+            self._ui_end_date_picker,
+            self._ui_date_format,
+            *self.exclude_day_checkboxes,
+            self._ui_exclude_new_range,
+            self._ui_save_as_new_file,
+            self._ui_generate_button,
+        ]
+        self._state_readonly_widgets = [self._ui_table_index, self._ui_table_column]
+
+        self._set_ui_state(enabled=False)
+
+    def _close_handler(self) -> None:
+        # Drop queued parses. One that's already running can't be interrupted and still finishes before exit.
+        self._parse_executor.shutdown(wait=False, cancel_futures=True)
+        self.destroy()
+
+    def _set_ui_state(self, enabled: bool) -> None:
+        """
+        Sets the UI state based on the value of `enabled`.
+
+        Args:
+            enabled (bool): A boolean value indicating whether the UI should be enabled or disabled.
+
+        Returns:
+            None: This function does not return anything.
+        """
+
+        state = "normal" if enabled else "disabled"
+        for widget in self._state_widgets:
+            widget.configure(state=state)
+        # Comboboxes are read-only when enabled so only the listed options can be chosen.
+        readonly_state = "readonly" if enabled else "disabled"
+        for widget in self._state_readonly_widgets:
+            widget.configure(state=readonly_state)
+        for range_element in self.exclude_ranges.values():
+            range_element.enabled(enabled)
+
+    def _open_file_picker(self) -> None:
+        """
+        Opens a file picker and creates the document object with the chosen file.
+        """
+
+        path = ctk.filedialog.askopenfilename(filetypes=[("Word Documents", "*.docx")])
+        if path:
+            self._ui_path_entry.delete(0, ctk.END)
+            self._ui_path_entry.insert(0, path)
+            self._path_entry_handler()
+
+    def _path_entry_handler(self, *args) -> None:
+        # Wait for typing to pause before parsing so consecutive keystrokes only parse once.
+        if self._pending_parse is not None:
+            self.after_cancel(self._pending_parse)
+        self._pending_parse = self.after(250, self._parse_document)
+
+    def _parse_document(self) -> None:
+        """
+        Starts parsing the document at the entered path on the worker thread.
+        """
+
+        self._pending_parse = None
+
+        path = self._ui_path_entry.get()
+        try:
+            modified_time = os.path.getmtime(path)
+        except OSError:
+            modified_time = None
+
+        # A queued parse for an older path would only delay this one. A parse that's already running can't be
+        # stopped, and its result is ignored.
+        if self._parse_future is not None:
+            self._parse_future.cancel()
+
+        cached = self._doc_cache.get(path)
+        if cached is not None and cached[0] == modified_time:
+            future = Future()
+            future.set_result(cached[1])
+            self._parse_future = future
+            self._document_parsed(future, path, modified_time)
+            return
+
+        future = self._parse_executor.submit(WordDateGenerator, path)
+        self._parse_future = future
+        self.after(50, self._poll_parse, future, path, modified_time)
+
+    def _poll_parse(self, future: Future, path: str, modified_time: float | None) -> None:
+        """
+        Waits on the Tk thread for a parse to finish, since Tk can't be called from the worker thread.
+
+        Args:
+            future (Future): The running parse.
+            path (str): The path being parsed.
+            modified_time (float | None): The file's modification time when parsing started, if it exists.
+        """
+
+        if future is not self._parse_future:
+            return
+
+        if future.done():
+            self._document_parsed(future, path, modified_time)
+        else:
+            self.after(50, self._poll_parse, future, path, modified_time)
+
+    def _document_parsed(self, future: Future, path: str, modified_time: float | None) -> None:
+        """
+        Swaps in the parsed document on the Tk thread once parsing has finished.
+
+        Args:
+            future (Future): The finished parse. Ignored if a newer parse has been started since.
+            path (str): The path that was parsed.
+            modified_time (float | None): The file's modification time when parsing started, if it exists.
+        """
+
+        if future is not self._parse_future:
+            return
+
+        try:
+            document = future.result()
+        except Exception:
+            # Missing files, files that aren't Word documents and documents without tables can't be used, so keep
+            # the previous document and leave the controls disabled.
+            self._set_ui_state(enabled=False)
+            self._ui_generate_button.configure(text="Generate")
+            return
+
+        previous_document = self.document
+        self.document = document
+        if modified_time is not None:
+            self._cache_document(path, modified_time, document)
+        self._release_document(previous_document)
+
+        self._set_ui_state(enabled=True)
+        self._ui_generate_button.configure(text="Generate")
+
+        table_options = [str(i + 1) for i in range(len(self.document.doc.tables))]
+        self._ui_table_index.configure(values=table_options)
+        self._ui_table_index.set(table_options[0])
+
+        # Write options showing on-screen to the WordDateGenerator object
+        self.document.start_date = self._ui_start_date_picker.get_date()
+        self.document.end_date = self._ui_end_date_picker.get_date()
+        self._table_index_handler()
+        self.document.date_format = self._ui_date_format.get()
+        self.document.excluded_days = self._excluded_days
+        self.document.excluded_date_ranges = self.exclude_ranges.values()
+
+    def _cache_document(self, path: str, modified_time: float, document: WordDateGenerator) -> None:
+        """
+        Remembers an unmodified document so it can be reused while the file on disk doesn't change.
+
+        Args:
+            path (str): The path the document was parsed from.
+            modified_time (float): The file's modification time when it was parsed.
+            document (WordDateGenerator): The parsed document.
+        """
+
+        replaced = self._doc_cache.get(path)
+        self._doc_cache[path] = (modified_time, document)
+        self._doc_cache.move_to_end(path)
+        if replaced is not None and replaced[1] is not document:
+            self._release_document(replaced[1])
+
+        while len(self._doc_cache) > _DOCUMENT_CACHE_SIZE:
+            _, (_, evicted) = self._doc_cache.popitem(last=False)
+            self._release_document(evicted)
+
+    def _release_document(self, document: WordDateGenerator | None) -> None:
+        """
+        Closes a document unless it's still in use or cached.
+
+        Args:
+            document (WordDateGenerator | None): The document to release.
+        """
+
+        if document is None or document is self.document:
+            return
+
+        cached = self._doc_cache.get(document.path)
+        if cached is not None and cached[1] is document:
+            return
+
+        document.close()
+
+    def _start_date_picker_handler(self, *args) -> None:
+        if self.document is not None:
+            self.document.start_date = self._ui_start_date_picker.get_date()
+
+    def _end_date_picker_handler(self, *args) -> None:
+        if self.document is not None:
+            self.document.end_date = self._ui_end_date_picker.get_date()
+
+    def _table_index_handler(self, *args) -> None:
+        if self.document is None:
+            return
+
+        self.document.selected_table = self.document.doc.tables[int(self._ui_table_index.get()) - 1]
+
+        column_options = [str(i + 1) for i in range(len(self.document.selected_table.columns))]
+        self._ui_table_column.configure(values=column_options)
+        self._ui_table_column.set(column_options[0])
+        self._table_column_handler()
+
+    def _table_column_handler(self, *args) -> None:
+        if self.document is not None:
+            self.document.date_column = int(self._ui_table_column.get()) - 1
+
+    def _weekday_checkbox_handler(self, weekday: str, checkbox_value: ctk.BooleanVar) -> None:
+        if checkbox_value.get():
+            self._excluded_days.add(weekday)
+        else:
+            self._excluded_days.discard(weekday)
+
+    def _date_format_handler(self, *args) -> None:
+        date_format = self._ui_date_format.get()
+        if self.document is not None:
+            self.document.date_format = date_format
+        self._ui_date_format_preview.configure(text=date.today().strftime(date_format))
+
+    def _exclude_new_range_handler(self) -> None:
+        date_range = DateRangeElement(self._ui_exclude_range_rows, on_remove=self._remove_date_range_element)
+        self.exclude_ranges[id(date_range)] = date_range
+
+        date_range.pack(fill=ctk.X, padx=15, pady=10)
+
+    def _remove_date_range_element(self, date_range_element: DateRangeElement) -> None:
+        del self.exclude_ranges[id(date_range_element)]
+
+    def _generate(self) -> None:
+        """
+        Fills the table with dates and saves the file.
+        """
+
+        self.document.add_dates_to_table()
+        # The document no longer matches the file on disk, so it mustn't be handed out from the cache again.
+        self._doc_cache.pop(self.document.path, None)
+
+        if self._ui_save_as_new_file.get():
+            path = ctk.filedialog.asksaveasfilename(filetypes=[("Word Documents", "*.docx")])
+            if path:
+                if not path.endswith(".docx"):
+                    path += ".docx"
+                self.document.save(path)
+            else:
+                return
+        else:
+            self.document.save()
+
+        # The filled-in document isn't needed after saving, so free it rather than keeping it alive until the next
+        # file is chosen. The path is cleared too so it's clear a file has to be chosen again.
+        self.document.close()
+        self.document = None
+        if self._pending_parse is not None:
+            self.after_cancel(self._pending_parse)
+            self._pending_parse = None
+        if self._parse_future is not None:
+            self._parse_future.cancel()
+            self._parse_future = None
+        self._ui_path_entry.delete(0, ctk.END)
+        self._set_ui_state(enabled=False)
+        self._ui_generate_button.configure(text="Done!")
+
+
+if __name__ == "__main__":
+    ctk.set_appearance_mode("dark")
+    ctk.set_default_color_theme("blue")
+
+    app = App()
+    app.mainloop()